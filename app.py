@@ -6,10 +6,11 @@ Created on Thu Oct 23 13:33:36 2025
 @author: syed
 """
 
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 import plotly.express as px
 from scipy.stats import gaussian_kde
@@ -19,32 +20,12 @@ from scipy.stats import gaussian_kde
 # ===========================
 st.set_page_config(page_title="Supply Chain Analytics Dashboard", layout="wide", page_icon="📦")
 
-# Custom CSS
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .section-header {
-        font-size: 1.8rem;
-        font-weight: bold;
-        color: #ff7f0e;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
 # ===========================
 # DATA LOADING FUNCTION
 # ===========================
 @st.cache_data
 def load_data(file):
-    df = pd.read_csv(file)
+    df = pd.read_csv(file, engine='pyarrow')
     
     # Data cleaning
     df = df.loc[:, ~df.columns.duplicated()]
@@ -58,38 +39,225 @@ def load_data(file):
         'Customer demographics': 'Unknown'
     })
     
-    df['Price'] = df['Price'].astype(float)
-    df['Revenue generated'] = df['Revenue generated'].astype(float)
-    df['Shipping costs'] = df['Shipping costs'].astype(float)
-    
-    # Feature engineering
-    low_price = df['Price'].quantile(0.25)
-    high_price = df['Price'].quantile(0.75)
-    bins_price = [0, low_price, high_price, df['Price'].max()]
-    labels_price = ['Low cost', 'Medium range', 'Premium']
-    df['PriceDistribution'] = pd.cut(df['Price'], bins_price, labels_price)
-    
-    low_revenue = df['Revenue generated'].quantile(0.25)
-    high_revenue = df['Revenue generated'].quantile(0.75)
-    bins_revenue = [0, low_revenue, high_revenue, df['Revenue generated'].max()]
-    labels_revenue = ['Low Value Cluster', 'Medium Value Cluster', 'High Value Cluster']
-    df['Customer_cluster_revenue'] = pd.cut(df['Revenue generated'], bins=bins_revenue, labels=labels_revenue, include_lowest=True)
-    
-    low_defect = df['Defect rates'].quantile(0.25)
-    high_defect = df['Defect rates'].quantile(0.75)
-    bins_defect = [0, low_defect, high_defect, df['Defect rates'].max()]
-    labels_defect = ['Low Defects', 'Medium Defects', 'High Defects']
-    df['Defect_rate_cluster'] = pd.cut(df['Defect rates'], bins=bins_defect, labels=labels_defect, include_lowest=True)
+    for col in ['Price', 'Revenue generated', 'Shipping costs']:
+        if df[col].dtype != np.float64:
+            df[col] = df[col].astype(np.float64, copy=False)
+    
+    # Low-cardinality group keys: categorical codes make groupby/value_counts cheap
+    for col in ['Supplier name', 'Shipping carriers', 'Customer demographics',
+                'Transportation modes', 'Routes', 'Product type']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    # Feature engineering (quartile-based segments)
+    segments = {
+        'Price': ('PriceDistribution', ['Low cost', 'Medium range', 'Premium']),
+        'Revenue generated': ('Customer_cluster_revenue', ['Low Value Cluster', 'Medium Value Cluster', 'High Value Cluster']),
+        'Defect rates': ('Defect_rate_cluster', ['Low Defects', 'Medium Defects', 'High Defects']),
+    }
+    for col, (segment_col, labels) in segments.items():
+        values = df[col].to_numpy(dtype=np.float64)
+        missing = np.isnan(values)
+        quartiles = np.quantile(values[~missing], [0.25, 0.75], method='linear')
+        # right=True keeps pd.cut's right-closed bins: (.., q25], (q25, q75], (q75, ..]
+        codes = np.digitize(values, quartiles, right=True)
+        # Code -1 leaves rows with a missing value unlabeled
+        codes = np.where(missing, -1, codes)
+        df[segment_col] = pd.Categorical.from_codes(codes, labels)
     
     return df
 
+# ===========================
+# CACHED COMPUTATIONS
+# ===========================
+@st.cache_data
+def _csv_bytes(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data
+def _describe(df):
+    return df.describe(include=[np.number])
+
+
+@st.cache_data
+def _missing_values(df):
+    return df.isna().sum()
+
+
+@st.cache_data
+def _corr(df):
+    return df.corr(numeric_only=True)
+
+
+@st.cache_data
+def _top_products(df):
+    return df.groupby('SKU', observed=True, sort=False, as_index=False).agg({
+        'Number of products sold': 'sum',
+        'Revenue generated': 'sum'
+    }).sort_values(by='Revenue generated', ascending=False).head(10)
+
+
+@st.cache_data
+def _price_stats(df):
+    price_stats = df.groupby('PriceDistribution', observed=True, as_index=False)['Revenue generated'].agg(['count', 'sum', 'mean'])
+    price_stats.columns = ['Price Segment', 'Count', 'Total Revenue', 'Avg Revenue']
+    return price_stats
+
+
+@st.cache_data
+def _demographic_revenue(df):
+    return (df.groupby('Customer demographics', observed=True, sort=False, as_index=False)['Revenue generated']
+            .sum()
+            .sort_values(by='Revenue generated', ascending=False))
+
+
+@st.cache_data
+def _cluster_counts(df):
+    return df['Customer_cluster_revenue'].value_counts(sort=False)
+
+
+@st.cache_data
+def _cluster_revenue(df):
+    return df.groupby('Customer_cluster_revenue', observed=True, as_index=False)['Revenue generated'].sum()
+
+
+@st.cache_data
+def _supplier_lead_time(df):
+    return df.groupby('Supplier name', observed=True, as_index=False)['Lead time'].mean()
+
+
+@st.cache_data
+def _defect_cluster_costs(df):
+    return df.groupby('Defect_rate_cluster', observed=True, as_index=False)['Manufacturing costs'].agg(['sum', 'mean'])
+
+
+@st.cache_data
+def _shipping_stats(df):
+    return df.groupby('Shipping carriers', observed=True, as_index=False).agg({
+        'Shipping times': 'mean',
+        'Shipping costs': 'mean'
+    })
+
+
+@st.cache_data
+def _transport_counts(df):
+    return (df.groupby('Transportation modes', observed=True, sort=False, as_index=False).size()
+            .rename(columns={'Transportation modes': 'Mode', 'size': 'Count'})
+            .sort_values('Count', ascending=False, ignore_index=True))
+
+
+@st.cache_data
+def _route_costs(df):
+    return df.groupby('Routes', observed=True, as_index=False).agg({
+        'Transportation_costs': 'mean'
+    })
+
+
+@st.cache_data
+def _kpis(df):
+    totals = df.agg({'Revenue generated': 'sum', 'Number of products sold': 'sum'})
+    return {
+        'records': len(df),
+        'revenue': float(totals['Revenue generated']),
+        'products_sold': int(totals['Number of products sold']),
+        'unique_skus': df['SKU'].nunique(),
+    }
+
+
+@st.cache_data
+def _revenue_by_type(df):
+    return df.groupby('Product type', observed=True, as_index=False)['Revenue generated'].sum()
+
+
+def _pairwise_corr(x, y):
+    # Pearson correlation over rows where both values are present, like Series.corr
+    present = ~(np.isnan(x) | np.isnan(y))
+    return float(np.corrcoef(x[present], y[present])[0, 1])
+
+
+@st.cache_data
+def _diagnostic_stats(df):
+    lead = df['Lead time'].to_numpy(dtype=np.float64)
+    stock = df['Stock levels'].to_numpy(dtype=np.float64)
+    defect = df['Defect rates'].to_numpy(dtype=np.float64)
+    return {
+        'median_lead': float(np.nanmedian(lead)),
+        'median_stock': float(np.nanmedian(stock)),
+        'median_defect': float(np.nanmedian(defect)),
+        'corr_lead_stock': _pairwise_corr(lead, stock),
+        'corr_lead_defect': _pairwise_corr(lead, defect),
+    }
+
+
+@st.cache_data
+def _carrier_distribution(df):
+    return (df.groupby('Shipping carriers', observed=True, sort=False, as_index=False).size()
+            .rename(columns={'Shipping carriers': 'Carrier', 'size': 'Count'})
+            .sort_values('Count', ascending=False, ignore_index=True))
+
+# ===========================
+# CACHED FIGURES
+# ===========================
+def _png_bytes(fig):
+    # Same rendering options st.pyplot uses
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    return buf.getvalue()
+
+
+@st.cache_data(max_entries=8)
+def _correlation_heatmap(df):
+    corr = _corr(df)
+    
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    sns.heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm', ax=ax, linewidths=0.5)
+    return _png_bytes(fig)
+
+
+@st.cache_data(max_entries=8)
+def _price_boxplot(df):
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    sns.boxplot(x=df['Price'], color='lightcoral', ax=ax)
+    ax.set_title('Finding Premium Outliers Range')
+    ax.set_xlabel('Price')
+    return _png_bytes(fig)
+
+
+@st.cache_data(max_entries=8)
+def _demographic_revenue_figure(df):
+    demo_rev_cont = _demographic_revenue(df)
+    
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    sns.barplot(x=demo_rev_cont['Customer demographics'], 
+               y=demo_rev_cont['Revenue generated'], 
+               data=demo_rev_cont, order=demo_rev_cont['Customer demographics'],
+               palette='Set2', ax=ax)
+    ax.set_title('Revenue Distribution By Demographic Data')
+    ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
+    return _png_bytes(fig)
+
+
+@st.cache_data(max_entries=8)
+def _cluster_count_figure(df):
+    fig = Figure(figsize=(7, 6))
+    ax = fig.subplots()
+    sns.countplot(x=df['Customer_cluster_revenue'], palette='viridis', ax=ax)
+    ax.set_title('Revenue-based Customer Segmentation', fontsize=14)
+    ax.set_xlabel("Customer Cluster (by Revenue)")
+    ax.set_ylabel("Number of Customers")
+    return _png_bytes(fig)
+
 # ===========================
 # PAGE FUNCTIONS
 # ===========================
 
 def home_page():
     """Empty home page"""
-    st.markdown('<p class="main-header">📦 Supply Chain Management Analytics Dashboard</p>', unsafe_allow_html=True)
+    st.title('📦 Supply Chain Management Analytics Dashboard')
     
     st.markdown("""
     ### Welcome to the Supply Chain Analytics Dashboard
@@ -118,30 +286,29 @@ def home_page():
 
 def data_overview_page(df):
     """Data Overview page"""
-    st.markdown('<p class="section-header">Data Overview</p>', unsafe_allow_html=True)
+    st.header('Data Overview')
     
     tab1, tab2, tab3, tab4 = st.tabs(["📋 Dataset", "📊 Statistics", "🔍 Missing Values", "📈 Correlations"])
     
     with tab1:
         st.subheader("Dataset Preview")
-        show_rows = st.slider("Number of rows to display", 10, 100, 50)
-        st.dataframe(df.head(show_rows), use_container_width=True)
+        st.dataframe(df, use_container_width=True, height=400)
         st.write(f"**Shape:** {df.shape[0]} rows × {df.shape[1]} columns")
         
         st.download_button(
             label="📥 Download Full Dataset",
-            data=df.to_csv(index=False).encode('utf-8'),
+            data=_csv_bytes(df),
             file_name='supply_chain_cleaned.csv',
             mime='text/csv',
         )
     
     with tab2:
         st.subheader("Statistical Summary")
-        st.dataframe(df.describe(), use_container_width=True)
+        st.dataframe(_describe(df), use_container_width=True)
     
     with tab3:
         st.subheader("Missing Values Analysis")
-        missing = df.isnull().sum()
+        missing = _missing_values(df)
         if missing.sum() == 0:
             st.success("✅ No missing values found!")
         else:
@@ -149,263 +316,215 @@ def data_overview_page(df):
     
     with tab4:
         st.subheader("Correlation Heatmap")
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        corr = df[numeric_cols].corr()
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        sns.heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm', ax=ax, linewidths=0.5)
-        st.pyplot(fig)
+        st.image(_correlation_heatmap(df), use_container_width=True)
 
 
 def product_analysis_page(df):
     """Product Analysis page"""
-    st.markdown('<p class="section-header">Product Analysis</p>', unsafe_allow_html=True)
+    st.header('Product Analysis')
+    
+    top_products = _top_products(df)
+    price_stats = _price_stats(df)
     
     tab1, tab2, tab3 = st.tabs(["Top Products", "Price Distribution", "Product Segmentation"])
     
     with tab1:
         st.subheader("Top 10 SKUs by Revenue")
-        top_products = df.groupby('SKU').agg({
-            'Number of products sold': 'sum',
-            'Revenue generated': 'sum'
-        }).sort_values(by='Revenue generated', ascending=False).head(10)
-        
-        st.dataframe(top_products, use_container_width=True)
+        st.dataframe(top_products, use_container_width=True, hide_index=True)
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.barplot(x=top_products.index, y=top_products['Revenue generated'], palette='viridis', ax=ax)
-        ax.set_title("Top 10 SKUs by Revenue", fontsize=14)
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
-        st.pyplot(fig)
+        fig = px.bar(top_products, x='SKU', y='Revenue generated', color='SKU',
+                     title="Top 10 SKUs by Revenue")
+        st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
         st.subheader("Price Distribution Across Products")
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.histplot(df['Price'], bins=50, kde=True, color='skyblue', ax=ax)
-        ax.set_title("Price Distribution Across Products", fontsize=14)
-        ax.set_xlabel("Price")
-        ax.set_ylabel("Count")
-        st.pyplot(fig)
+        # Binning and the violin density are computed in the browser, no server-side KDE
+        fig = px.histogram(df, x='Price', nbins=50, marginal='violin', color_discrete_sequence=['skyblue'],
+                           title="Price Distribution Across Products")
+        fig.update_layout(yaxis_title="Count")
+        st.plotly_chart(fig, use_container_width=True)
         
         st.subheader("Finding Premium Outliers")
-        fig, ax = plt.subplots(figsize=(8, 5))
-        sns.boxplot(x=df['Price'], color='lightcoral', ax=ax)
-        ax.set_title('Finding Premium Outliers Range')
-        ax.set_xlabel('Price')
-        st.pyplot(fig)
+        st.image(_price_boxplot(df), use_container_width=True)
     
     with tab3:
         st.subheader("Product Segmentation by Price")
         
-        fig, ax = plt.subplots(figsize=(7, 5))
-        sns.countplot(x=df['PriceDistribution'], palette='viridis', ax=ax)
-        ax.set_title('Product Segmentation by Price')
-        st.pyplot(fig)
+        fig = px.bar(price_stats, x='Price Segment', y='Count', color='Price Segment',
+                     title='Product Segmentation by Price')
+        st.plotly_chart(fig, use_container_width=True)
         
-        price_stats = df.groupby('PriceDistribution')['Revenue generated'].agg(['count', 'sum', 'mean']).reset_index()
-        price_stats.columns = ['Price Segment', 'Count', 'Total Revenue', 'Avg Revenue']
         st.dataframe(price_stats, use_container_width=True)
 
 
 def customer_segmentation_page(df):
     """Customer Segmentation page"""
-    st.markdown('<p class="section-header">Customer Segmentation Analysis</p>', unsafe_allow_html=True)
+    st.header('Customer Segmentation Analysis')
+    
+    demo_rev_cont = _demographic_revenue(df)
+    cluster_counts = _cluster_counts(df)
+    cal_cluster_revenue = _cluster_revenue(df)
     
     tab1, tab2 = st.tabs(["Demographic Analysis", "Customer Clusters"])
     
     with tab1:
         st.subheader("Revenue Distribution by Demographics")
         
-        demo_rev_cont = (df.groupby('Customer demographics')['Revenue generated']
-                         .sum().reset_index()
-                         .sort_values(by='Revenue generated', ascending=False))
-        
         st.dataframe(demo_rev_cont, use_container_width=True)
         
-        fig, ax = plt.subplots(figsize=(8, 5))
-        sns.barplot(x=demo_rev_cont['Customer demographics'], 
-                   y=demo_rev_cont['Revenue generated'], 
-                   data=demo_rev_cont, palette='Set2', ax=ax)
-        ax.set_title('Revenue Distribution By Demographic Data')
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
-        st.pyplot(fig)
+        st.image(_demographic_revenue_figure(df), use_container_width=True)
     
     with tab2:
         st.subheader("Revenue-based Customer Segmentation")
         
-        cluster_counts = df['Customer_cluster_revenue'].value_counts()
         st.write("**Cluster Distribution:**")
         st.write(cluster_counts)
         
-        fig, ax = plt.subplots(figsize=(7, 6))
-        sns.countplot(x=df['Customer_cluster_revenue'], palette='viridis', ax=ax)
-        ax.set_title('Revenue-based Customer Segmentation', fontsize=14)
-        ax.set_xlabel("Customer Cluster (by Revenue)")
-        ax.set_ylabel("Number of Customers")
-        st.pyplot(fig)
+        st.image(_cluster_count_figure(df), use_container_width=True)
         
-        cal_cluster_revenue = df.groupby('Customer_cluster_revenue')['Revenue generated'].sum().reset_index()
         st.dataframe(cal_cluster_revenue, use_container_width=True)
 
 
 def supplier_analysis_page(df):
     """Supplier Analysis page"""
-    st.markdown('<p class="section-header">Supplier Analysis</p>', unsafe_allow_html=True)
+    st.header('Supplier Analysis')
+    
+    average_lead_time = _supplier_lead_time(df)
+    manufacturing_cost_defect = _defect_cluster_costs(df)
     
     tab1, tab2 = st.tabs(["Lead Time Analysis", "Cost vs Defect Analysis"])
     
     with tab1:
         st.subheader("Average Lead Time per Supplier")
         
-        average_lead_time = df.groupby('Supplier name')['Lead time'].mean().reset_index()
         st.dataframe(average_lead_time, use_container_width=True)
         
-        fig, ax = plt.subplots(figsize=(8, 6))
-        sns.barplot(x='Supplier name', y='Lead time', data=average_lead_time, palette='viridis', ax=ax)
-        ax.set_title('Average Lead Time per Supplier', fontsize=14)
-        ax.set_xlabel('Supplier Name')
-        ax.set_ylabel('Average Lead Time (days)')
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
-        st.pyplot(fig)
+        fig = px.bar(average_lead_time, x='Supplier name', y='Lead time', color='Supplier name',
+                     title='Average Lead Time per Supplier',
+                     labels={'Supplier name': 'Supplier Name', 'Lead time': 'Average Lead Time (days)'})
+        st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
         st.subheader("Cost vs Defect Rates Trade-off")
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.scatterplot(x='Manufacturing costs', y='Defect rates', data=df, hue='Supplier name', s=100, ax=ax)
-        ax.set_title("Cost vs Defect Rates")
-        st.pyplot(fig)
+        fig = px.scatter(df, x='Manufacturing costs', y='Defect rates', color='Supplier name',
+                         title="Cost vs Defect Rates", render_mode='webgl')
+        st.plotly_chart(fig, use_container_width=True)
         
         st.subheader("Manufacturing Cost by Defect Cluster")
         
-        manufacturing_cost_defect_total = df.groupby('Defect_rate_cluster')['Manufacturing costs'].sum().reset_index()
-        manufacturing_cost_defect_efficiency = df.groupby('Defect_rate_cluster')['Manufacturing costs'].mean().reset_index()
-        
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-        
-        sns.barplot(x='Defect_rate_cluster', y='Manufacturing costs', data=manufacturing_cost_defect_total, ax=axes[0], palette="viridis")
-        axes[0].set_title("Total Manufacturing Cost by Defect Cluster")
-        
-        sns.barplot(x='Defect_rate_cluster', y='Manufacturing costs', data=manufacturing_cost_defect_efficiency, ax=axes[1], palette="magma")
-        axes[1].set_title("Average Manufacturing Cost (Efficiency) by Defect Cluster")
-        
-        st.pyplot(fig)
+        col1, col2 = st.columns(2)
+        with col1:
+            fig = px.bar(manufacturing_cost_defect, x='Defect_rate_cluster', y='sum', color='Defect_rate_cluster',
+                         title="Total Manufacturing Cost by Defect Cluster",
+                         labels={'sum': 'Manufacturing costs'})
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            fig = px.bar(manufacturing_cost_defect, x='Defect_rate_cluster', y='mean', color='Defect_rate_cluster',
+                         title="Average Manufacturing Cost (Efficiency) by Defect Cluster",
+                         labels={'mean': 'Manufacturing costs'})
+            st.plotly_chart(fig, use_container_width=True)
 
 
 def logistics_analysis_page(df):
     """Logistics Analysis page"""
-    st.markdown('<p class="section-header">Logistics Analysis</p>', unsafe_allow_html=True)
+    st.header('Logistics Analysis')
+    
+    shipping_stats = _shipping_stats(df)
+    transport_counts = _transport_counts(df)
+    route_wise_cost = _route_costs(df)
     
     tab1, tab2, tab3 = st.tabs(["Shipping Analysis", "Transportation Modes", "Route Efficiency"])
     
     with tab1:
         st.subheader("Average Shipping Times & Costs by Carrier")
         
-        shipping_stats = df.groupby('Shipping carriers').agg({
-            'Shipping times': 'mean',
-            'Shipping costs': 'mean'
-        }).reset_index()
-        
         st.dataframe(shipping_stats, use_container_width=True)
         
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-        
-        sns.barplot(x='Shipping carriers', y='Shipping times', data=shipping_stats, color='skyblue', ax=axes[0])
-        axes[0].set_title("Avg. Shipping Time by Carrier")
-        axes[0].set_ylabel("Days")
-        
-        sns.barplot(x='Shipping carriers', y='Shipping costs', data=shipping_stats, color='red', ax=axes[1])
-        axes[1].set_title("Avg. Shipping Cost by Carrier")
-        axes[1].set_ylabel("Cost")
-        
-        plt.tight_layout()
-        st.pyplot(fig)
+        col1, col2 = st.columns(2)
+        with col1:
+            fig = px.bar(shipping_stats, x='Shipping carriers', y='Shipping times',
+                         color_discrete_sequence=['skyblue'], title="Avg. Shipping Time by Carrier",
+                         labels={'Shipping times': 'Days'})
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            fig = px.bar(shipping_stats, x='Shipping carriers', y='Shipping costs',
+                         color_discrete_sequence=['red'], title="Avg. Shipping Cost by Carrier",
+                         labels={'Shipping costs': 'Cost'})
+            st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
         st.subheader("Most Used Transportation Modes")
         
-        transport_counts = df['Transportation modes'].value_counts().reset_index()
-        transport_counts.columns = ['Mode', 'Count']
         st.dataframe(transport_counts, use_container_width=True)
         
-        fig, ax = plt.subplots(figsize=(7, 5))
-        sns.countplot(x='Transportation modes', data=df, palette='Set3', ax=ax)
-        ax.set_xlabel('Transport Mode')
-        ax.set_ylabel('Transport Frequency')
-        ax.set_title('Most Used Transportation')
-        st.pyplot(fig)
+        fig = px.bar(transport_counts, x='Mode', y='Count', color='Mode', title='Most Used Transportation',
+                     labels={'Mode': 'Transport Mode', 'Count': 'Transport Frequency'})
+        st.plotly_chart(fig, use_container_width=True)
     
     with tab3:
         st.subheader("Route-wise Cost Efficiency")
         
-        route_wise_cost = df.groupby('Routes').agg({
-            'Transportation_costs': 'mean'
-        }).reset_index()
-        
         st.dataframe(route_wise_cost, use_container_width=True)
         
-        fig, ax = plt.subplots(figsize=(7, 5))
-        sns.barplot(x='Routes', y='Transportation_costs', data=route_wise_cost, palette='coolwarm', ax=ax)
-        ax.set_title("Route-wise Cost Efficiency")
-        ax.set_xlabel('Routes')
-        ax.set_ylabel('Cost Efficiency')
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
-        st.pyplot(fig)
+        fig = px.bar(route_wise_cost, x='Routes', y='Transportation_costs', color='Routes',
+                     title="Route-wise Cost Efficiency", labels={'Transportation_costs': 'Cost Efficiency'})
+        st.plotly_chart(fig, use_container_width=True)
 
 
 def diagnostic_analytics_page(df):
     """Diagnostic Analytics page"""
-    st.markdown('<p class="section-header">Diagnostic Analytics (Root Cause Analysis)</p>', unsafe_allow_html=True)
+    st.header('Diagnostic Analytics (Root Cause Analysis)')
+    
+    stats = _diagnostic_stats(df)
     
     tab1, tab2 = st.tabs(["Inventory Bottlenecks", "Supplier Reliability"])
     
     with tab1:
         st.subheader("Stock Levels vs Lead Time Analysis")
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.scatterplot(x='Lead time', y='Stock levels', data=df, hue='Supplier name', s=100, ax=ax)
-        ax.set_xlabel('Supplier Lead Time (days)')
-        ax.set_ylabel('Stock Level')
-        ax.set_title('Stock Level vs Lead Time')
-        ax.axvline(x=df['Lead time'].median(), color='red', linestyle='--', label='Median Lead Time')
-        ax.axhline(y=df['Stock levels'].median(), color='blue', linestyle='--', label='Median Stock Level')
-        ax.legend()
-        st.pyplot(fig)
+        fig = px.scatter(df, x='Lead time', y='Stock levels', color='Supplier name', title='Stock Level vs Lead Time',
+                         labels={'Lead time': 'Supplier Lead Time (days)', 'Stock levels': 'Stock Level'},
+                         render_mode='webgl')
+        fig.add_vline(x=stats['median_lead'], line_color='red', line_dash='dash', annotation_text='Median Lead Time')
+        fig.add_hline(y=stats['median_stock'], line_color='blue', line_dash='dash', annotation_text='Median Stock Level')
+        st.plotly_chart(fig, use_container_width=True)
         
-        correlation = df['Lead time'].corr(df['Stock levels'])
-        st.metric("Correlation (Lead Time vs Stock Levels)", f"{correlation:.4f}")
+        st.metric("Correlation (Lead Time vs Stock Levels)", f"{stats['corr_lead_stock']:.4f}")
     
     with tab2:
         st.subheader("Lead Time vs Defect Rates by Supplier")
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.scatterplot(x='Lead time', y='Defect rates', data=df, hue='Supplier name', s=100, ax=ax)
-        ax.set_xlabel('Lead Time (Days)')
-        ax.set_ylabel('Defect Rate')
-        ax.set_title('Lead Time vs Defect Rate by Suppliers')
-        ax.axvline(x=df['Lead time'].median(), color='red', linestyle='--')
-        ax.axhline(y=df['Defect rates'].median(), color='blue', linestyle='--')
-        st.pyplot(fig)
+        fig = px.scatter(df, x='Lead time', y='Defect rates', color='Supplier name',
+                         title='Lead Time vs Defect Rate by Suppliers',
+                         labels={'Lead time': 'Lead Time (Days)', 'Defect rates': 'Defect Rate'},
+                         render_mode='webgl')
+        fig.add_vline(x=stats['median_lead'], line_color='red', line_dash='dash')
+        fig.add_hline(y=stats['median_defect'], line_color='blue', line_dash='dash')
+        st.plotly_chart(fig, use_container_width=True)
         
-        correlation = df['Lead time'].corr(df['Defect rates'])
-        st.metric("Correlation (Lead Time vs Defect Rates)", f"{correlation:.4f}")
+        st.metric("Correlation (Lead Time vs Defect Rates)", f"{stats['corr_lead_defect']:.4f}")
 
 
 
 def main_analytics(df):
    
     
+    kpis = _kpis(df)
+    revenue_by_type = _revenue_by_type(df)
+    carrier_dist = _carrier_distribution(df)
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Records", f"{len(df):,}")
+        st.metric("Total Records", f"{kpis['records']:,}")
     with col2:
-        st.metric("Total Revenue", f"${df['Revenue generated'].sum():,.2f}")
+        st.metric("Total Revenue", f"${kpis['revenue']:,.2f}")
     with col3:
-        st.metric("Total Products Sold", f"{df['Number of products sold'].sum():,}")
+        st.metric("Total Products Sold", f"{kpis['products_sold']:,}")
     with col4:
-        st.metric("Unique SKUs", f"{df['SKU'].nunique():,}")
+        st.metric("Unique SKUs", f"{kpis['unique_skus']:,}")
     
     st.markdown("---")
     
@@ -419,14 +538,11 @@ def main_analytics(df):
     
     with col1:
         st.subheader("📈 Revenue by Product Type")
-        revenue_by_type = df.groupby('Product type')['Revenue generated'].sum().reset_index()
         fig = px.pie(revenue_by_type, values='Revenue generated', names='Product type', hole=0.4)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🚚 Shipping Carriers Distribution")
-        carrier_dist = df['Shipping carriers'].value_counts().reset_index()
-        carrier_dist.columns = ['Carrier', 'Count']
         fig = px.bar(carrier_dist, x='Carrier', y='Count', color='Carrier')
         st.plotly_chart(fig, use_container_width=True)
 